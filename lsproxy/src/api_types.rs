@@ -89,7 +89,7 @@ pub enum SupportedLanguages {
 }
 
 /// A position within a text document, using 0-based indexing
-#[derive(Debug, PartialEq, Clone, Serialize, Deserialize, ToSchema)]
+#[derive(Debug, PartialEq, Eq, PartialOrd, Ord, Clone, Serialize, Deserialize, ToSchema)]
 pub struct Position {
     /// 0-indexed line number.
     #[schema(example = 10)]
@@ -100,7 +100,7 @@ pub struct Position {
 }
 
 /// A position within a specific file in the workspace
-#[derive(Debug, PartialEq, Clone, Serialize, Deserialize, ToSchema)]
+#[derive(Debug, PartialEq, Eq, PartialOrd, Ord, Clone, Serialize, Deserialize, ToSchema)]
 pub struct FilePosition {
     /// Path to the file, relative to the workspace root
     #[schema(example = "src/main.py")]
@@ -120,13 +120,10 @@ pub struct FileRange {
 }
 
 impl FileRange {
-    pub fn contains(&self, position: FilePosition) -> bool {
-        let pos = &position.position;
-        self.path == position.path
-            && self.range.start.line <= pos.line
-            && self.range.end.line >= pos.line
-            && (self.range.start.line != pos.line || self.range.start.character <= pos.character)
-            && (self.range.end.line != pos.line || self.range.end.character >= pos.character)
+    pub fn contains(&self, position: &FilePosition) -> bool {
+        self.range.start <= position.position
+            && position.position <= self.range.end
+            && self.path == position.path
     }
 }
 
@@ -443,7 +440,7 @@ mod tests {
 
         // Test positions within the range
         assert!(
-            range.contains(FilePosition {
+            range.contains(&FilePosition {
                 path: range.path.clone(),
                 position: Position {
                     line: 11,
@@ -453,7 +450,7 @@ mod tests {
             "middle line should be contained"
         );
         assert!(
-            range.contains(FilePosition {
+            range.contains(&FilePosition {
                 path: range.path.clone(),
                 position: Position {
                     line: 10,
@@ -463,7 +460,7 @@ mod tests {
             "start position should be contained"
         );
         assert!(
-            range.contains(FilePosition {
+            range.contains(&FilePosition {
                 path: range.path.clone(),
                 position: Position {
                     line: 12,
@@ -491,7 +488,7 @@ mod tests {
         };
 
         assert!(
-            !range.contains(FilePosition {
+            !range.contains(&FilePosition {
                 path: range.path.clone(),
                 position: Position {
                     line: 9,
@@ -501,7 +498,7 @@ mod tests {
             "line before start should not be contained"
         );
         assert!(
-            !range.contains(FilePosition {
+            !range.contains(&FilePosition {
                 path: range.path.clone(),
                 position: Position {
                     line: 13,
@@ -511,7 +508,7 @@ mod tests {
             "line after end should not be contained"
         );
         assert!(
-            !range.contains(FilePosition {
+            !range.contains(&FilePosition {
                 path: range.path.clone(),
                 position: Position {
                     line: 10,
@@ -521,7 +518,7 @@ mod tests {
             "position before start on first line should not be contained"
         );
         assert!(
-            !range.contains(FilePosition {
+            !range.contains(&FilePosition {
                 path: range.path.clone(),
                 position: Position {
                     line: 12,
@@ -549,7 +546,7 @@ mod tests {
         };
 
         assert!(
-            single_line_range.contains(FilePosition {
+            single_line_range.contains(&FilePosition {
                 path: single_line_range.path.clone(),
                 position: Position {
                     line: 10,
@@ -559,7 +556,7 @@ mod tests {
             "position within single line range should be contained"
         );
         assert!(
-            !single_line_range.contains(FilePosition {
+            !single_line_range.contains(&FilePosition {
                 path: single_line_range.path.clone(),
                 position: Position {
                     line: 10,
@@ -569,7 +566,7 @@ mod tests {
             "position before single line range should not be contained"
         );
         assert!(
-            !single_line_range.contains(FilePosition {
+            !single_line_range.contains(&FilePosition {
                 path: single_line_range.path.clone(),
                 position: Position {
                     line: 10,
@@ -597,7 +594,7 @@ mod tests {
         };
 
         assert!(
-            zero_width_range.contains(FilePosition {
+            zero_width_range.contains(&FilePosition {
                 path: zero_width_range.path.clone(),
                 position: Position {
                     line: 10,
@@ -607,7 +604,7 @@ mod tests {
             "position at zero-width range should be contained"
         );
         assert!(
-            !zero_width_range.contains(FilePosition {
+            !zero_width_range.contains(&FilePosition {
                 path: zero_width_range.path.clone(),
                 position: Position {
                     line: 10,
@@ -617,7 +614,7 @@ mod tests {
             "position before zero-width range should not be contained"
         );
         assert!(
-            !zero_width_range.contains(FilePosition {
+            !zero_width_range.contains(&FilePosition {
                 path: zero_width_range.path.clone(),
                 position: Position {
                     line: 10,
@@ -79,10 +79,12 @@ impl AstGrepClient {
 
         // Filter matches to those within the symbol's range
         // And if not full_scan, exclude matches with rule_id "non-function"
+        let symbol_range = symbol_match.get_context_range();
         let contained_references = matches
             .into_iter()
             .filter(|m| {
-                let contained = symbol_match.contains(m);
+                let contained =
+                    m.file == symbol_match.file && symbol_range.contains(&m.get_context_range());
                 let all_ref = m.rule_id == "all-references";
 
                 // If we're doing a full scan, we want to use the more permissive "all-references"
@@ -114,11 +116,8 @@ impl AstGrepClient {
             return Err(format!("sg command failed: {}", error).into());
         }
 
-        let output = String::from_utf8(command_result.stdout)?;
-
-        let mut symbols: Vec<AstGrepMatch> =
-            serde_json::from_str(&output).map_err(|e| format!("Failed to parse JSON: {}", e))?;
-        symbols = symbols.into_iter().collect();
+        let mut symbols: Vec<AstGrepMatch> = serde_json::from_slice(&command_result.stdout)
+            .map_err(|e| format!("Failed to parse JSON: {}", e))?;
         symbols.sort_by_key(|s| s.get_identifier_range().start.line);
         Ok(symbols)
     }
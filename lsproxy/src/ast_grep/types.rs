@@ -41,16 +41,6 @@ impl AstGrepMatch {
     pub fn get_identifier_range(&self) -> AstGrepRange {
         self.meta_variables.single.name.range.clone()
     }
-
-    pub fn contains(&self, other: &AstGrepMatch) -> bool {
-        self.file == other.file
-            && self.get_context_range().start.line <= other.get_context_range().start.line
-            && self.get_context_range().end.line >= other.get_context_range().end.line
-            && (self.get_context_range().start.line != other.get_context_range().start.line
-                || self.get_context_range().start.column <= other.get_context_range().start.column)
-            && (self.get_context_range().end.line != other.get_context_range().end.line
-                || self.get_context_range().end.column >= other.get_context_range().end.column)
-    }
 }
 
 #[derive(Serialize, Deserialize, Debug, Clone)]
@@ -61,6 +51,12 @@ pub struct AstGrepRange {
     pub end: AstGrepPosition,
 }
 
+impl AstGrepRange {
+    pub fn contains(&self, other: &AstGrepRange) -> bool {
+        self.start <= other.start && other.end <= self.end
+    }
+}
+
 #[derive(Serialize, Deserialize, Debug, Clone)]
 #[serde(rename_all = "camelCase")]
 pub struct ByteOffset {
@@ -68,7 +64,7 @@ pub struct ByteOffset {
     pub end: usize,
 }
 
-#[derive(Serialize, Deserialize, Debug, Clone)]
+#[derive(Serialize, Deserialize, Debug, Clone, PartialEq, Eq, PartialOrd, Ord)]
 #[serde(rename_all = "camelCase")]
 pub struct AstGrepPosition {
     pub line: u32,
@@ -186,3 +182,117 @@ impl From<AstGrepMatch> for Identifier {
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn range(start_line: u32, start_column: u32, end_line: u32, end_column: u32) -> AstGrepRange {
+        AstGrepRange {
+            byte_offset: ByteOffset { start: 0, end: 0 },
+            start: AstGrepPosition {
+                line: start_line,
+                column: start_column,
+            },
+            end: AstGrepPosition {
+                line: end_line,
+                column: end_column,
+            },
+        }
+    }
+
+    #[test]
+    fn test_position_ordering_compares_line_before_column() {
+        assert!(
+            AstGrepPosition {
+                line: 1,
+                column: 100
+            } < AstGrepPosition { line: 2, column: 0 },
+            "an earlier line should sort first regardless of column"
+        );
+        assert!(
+            AstGrepPosition { line: 2, column: 3 } < AstGrepPosition { line: 2, column: 4 },
+            "on the same line the smaller column should sort first"
+        );
+    }
+
+    #[test]
+    fn test_contains_multi_line_range() {
+        let outer = range(10, 5, 12, 10);
+
+        assert!(
+            outer.contains(&range(11, 0, 11, 50)),
+            "middle line should be contained regardless of columns"
+        );
+        assert!(
+            outer.contains(&range(10, 5, 12, 10)),
+            "identical range should be contained"
+        );
+        assert!(
+            !outer.contains(&range(9, 0, 11, 0)),
+            "range starting on an earlier line should not be contained"
+        );
+        assert!(
+            !outer.contains(&range(10, 4, 11, 0)),
+            "range starting before the start column on the first line should not be contained"
+        );
+        assert!(
+            !outer.contains(&range(11, 0, 12, 11)),
+            "range ending after the end column on the last line should not be contained"
+        );
+    }
+
+    #[test]
+    fn test_contains_range_extending_past_end() {
+        let outer = range(10, 5, 12, 10);
+
+        assert!(
+            !outer.contains(&range(11, 0, 13, 0)),
+            "range ending on a later line should not be contained"
+        );
+        assert!(
+            !outer.contains(&range(13, 0, 14, 0)),
+            "range entirely after the end should not be contained"
+        );
+    }
+
+    #[test]
+    fn test_contains_single_line_range() {
+        let outer = range(10, 5, 10, 10);
+
+        assert!(
+            outer.contains(&range(10, 6, 10, 9)),
+            "range within the same line should be contained"
+        );
+        assert!(
+            outer.contains(&range(10, 5, 10, 10)),
+            "range on the column boundaries should be contained"
+        );
+        assert!(
+            !outer.contains(&range(10, 4, 10, 9)),
+            "range starting before the start column should not be contained"
+        );
+        assert!(
+            !outer.contains(&range(10, 6, 10, 11)),
+            "range ending after the end column should not be contained"
+        );
+    }
+
+    #[test]
+    fn test_contains_zero_width_range() {
+        let outer = range(10, 5, 10, 5);
+
+        assert!(
+            outer.contains(&range(10, 5, 10, 5)),
+            "zero-width range should contain itself"
+        );
+        assert!(
+            !outer.contains(&range(10, 4, 10, 5)),
+            "range starting before a zero-width range should not be contained"
+        );
+        assert!(
+            !outer.contains(&range(10, 5, 10, 6)),
+            "range ending after a zero-width range should not be contained"
+        );
+    }
+}
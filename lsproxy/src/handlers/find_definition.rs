@@ -1,4 +1,5 @@
 use crate::api_types::{CodeContext, ErrorResponse, FileRange, Position, Range};
+use crate::ast_grep::types::AstGrepMatch;
 use crate::handlers::error::IntoHttpResponse;
 use crate::handlers::utils;
 use crate::lsp::manager::{LspManagerError, Manager};
@@ -10,6 +11,7 @@ use log::{error, info, warn};
 use crate::api_types::{DefinitionResponse, GetDefinitionRequest};
 use crate::AppState;
 use lsp_types::{GotoDefinitionResponse, Location, Position as LspPosition, Range as LspRange};
+use std::collections::HashMap;
 /// Get the definition of a symbol at a specific position in a file
 ///
 /// Returns the location of the definition for the symbol at the given position.
@@ -130,9 +132,16 @@ async fn fetch_definition_source_code(
             .collect::<Vec<Location>>(),
     };
 
+    // Definitions often share a file, so scan each file with ast-grep at most once
+    let mut symbols_by_file: HashMap<String, Vec<AstGrepMatch>> = HashMap::new();
+
     for definition in definitions {
         let relative_path = uri_to_relative_path_string(&definition.uri);
-        let file_symbols = manager.definitions_in_file_ast_grep(&relative_path).await?;
+        if !symbols_by_file.contains_key(&relative_path) {
+            let file_symbols = manager.definitions_in_file_ast_grep(&relative_path).await?;
+            symbols_by_file.insert(relative_path.clone(), file_symbols);
+        }
+        let file_symbols = &symbols_by_file[&relative_path];
         let symbol = file_symbols.iter().find(|s| {
             s.get_identifier_range().start.line == definition.range.start.line
                 && s.get_identifier_range().start.column == definition.range.start.character
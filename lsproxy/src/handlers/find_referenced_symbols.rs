@@ -1,13 +1,19 @@
 use crate::api_types::{
     ErrorResponse, FilePosition, GetReferencedSymbolsRequest, Identifier, Position,
-    ReferenceWithSymbolDefinitions, ReferencedSymbolsResponse,
+    ReferenceWithSymbolDefinitions, ReferencedSymbolsResponse, Symbol,
 };
+use crate::ast_grep::types::AstGrepMatch;
 use crate::utils::file_utils::uri_to_relative_path_string;
 use crate::AppState;
 use actix_web::web::{Data, Json};
 use actix_web::HttpResponse;
+use futures::stream::{self, StreamExt};
 use log::{error, info};
 use lsp_types::{GotoDefinitionResponse, Position as LspPosition};
+use std::collections::{HashMap, HashSet};
+
+/// Upper bound on the ast-grep processes a single request runs at once
+const MAX_CONCURRENT_AST_GREP_SCANS: usize = 8;
 
 /// Find all symbols that are referenced from a given symbol's definition
 ///
@@ -110,9 +116,9 @@ pub async fn find_referenced_symbols(
             })
             .collect();
 
-    // First get the workspace files
-    let files = match data.manager.list_files().await {
-        Ok(files) => files,
+    // First get the workspace files, as a set since every definition is checked against it
+    let files: HashSet<String> = match data.manager.list_files().await {
+        Ok(files) => files.into_iter().collect(),
         Err(e) => {
             error!("Failed to list workspace files: {:?}", e);
             return HttpResponse::InternalServerError().json(ErrorResponse {
@@ -121,6 +127,26 @@ pub async fn find_referenced_symbols(
         }
     };
 
+    // Scan each workspace file that holds a definition once, rather than once per definition,
+    // running a bounded number of scans concurrently. The paths are already checked against
+    // `files`, so the scans skip the manager's workspace listing.
+    let definition_paths: HashSet<String> = unwrapped_definition_responses
+        .iter()
+        .flat_map(|(_, definitions)| definitions.iter())
+        .filter(|def| files.contains(&def.path))
+        .map(|def| def.path.clone())
+        .collect();
+    let manager = &data.manager;
+    let symbols_by_file: HashMap<String, Vec<AstGrepMatch>> = stream::iter(definition_paths)
+        .map(|path| async move {
+            let symbols = manager.ast_grep_symbols_in_file(&path).await;
+            (path, symbols)
+        })
+        .buffer_unordered(MAX_CONCURRENT_AST_GREP_SCANS)
+        .filter_map(|(path, symbols)| async move { symbols.ok().map(|symbols| (path, symbols)) })
+        .collect()
+        .await;
+
     // Then categorize the definitions
     let mut workspace_symbols = Vec::new();
     let mut external_symbols = Vec::new();
@@ -133,22 +159,21 @@ pub async fn find_referenced_symbols(
             // Check if any definition is in workspace files
             let has_internal_definition = definitions.iter().any(|def| files.contains(&def.path));
             if has_internal_definition {
-                let mut symbols_with_definitions = Vec::new();
-                for def in definitions.iter().filter(|def| files.contains(&def.path)) {
-                    if let Ok(symbol) = data
-                        .manager
-                        .get_symbol_from_position(
-                            &def.path,
-                            &lsp_types::Position {
-                                line: def.position.line,
-                                character: def.position.character,
-                            },
-                        )
-                        .await
-                    {
-                        symbols_with_definitions.push(symbol);
-                    }
-                }
+                let symbols_with_definitions: Vec<Symbol> = definitions
+                    .iter()
+                    .filter_map(|def| {
+                        symbols_by_file
+                            .get(&def.path)?
+                            .iter()
+                            .find(|s| {
+                                let identifier_start = s.get_identifier_range().start;
+                                identifier_start.line == def.position.line
+                                    && identifier_start.column == def.position.character
+                            })
+                            .cloned()
+                            .map(Symbol::from)
+                    })
+                    .collect();
                 // Only add to workspace_symbols if we found at least one symbol
                 if !symbols_with_definitions.is_empty() {
                     workspace_symbols.push(ReferenceWithSymbolDefinitions {
@@ -2,6 +2,7 @@ use actix_web::web::{Data, Json};
 use actix_web::HttpResponse;
 use log::{error, info};
 use lsp_types::{Location, Position as LspPosition};
+use std::collections::HashSet;
 
 use crate::api_types::{
     CodeContext, ErrorResponse, FilePosition, FileRange, GetReferencesRequest, Position, Range,
@@ -144,7 +145,7 @@ async fn find_and_filter_references(
         )
         .await?;
 
-    let files = manager.list_files().await?;
+    let files: HashSet<String> = manager.list_files().await?.into_iter().collect();
     let mut filtered_refs: Vec<_> = references
         .into_iter()
         .filter(|reference| {
@@ -154,12 +155,10 @@ async fn find_and_filter_references(
         .collect();
 
     filtered_refs.sort_by(|a, b| {
-        let uri_cmp = a.uri.to_string().cmp(&b.uri.to_string());
-        if uri_cmp.is_eq() {
-            a.range.start.line.cmp(&b.range.start.line)
-        } else {
-            uri_cmp
-        }
+        a.uri
+            .as_str()
+            .cmp(b.uri.as_str())
+            .then(a.range.start.line.cmp(&b.range.start.line))
     });
 
     Ok(filtered_refs)
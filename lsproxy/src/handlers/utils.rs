@@ -25,10 +25,7 @@ pub(crate) async fn find_identifier_at_position<'a>(
     identifiers: Vec<Identifier>,
     position: &FilePosition,
 ) -> Result<Identifier, PositionError> {
-    if let Some(exact_match) = identifiers
-        .iter()
-        .find(|i| i.file_range.contains(position.clone()))
-    {
+    if let Some(exact_match) = identifiers.iter().find(|i| i.file_range.contains(position)) {
         return Ok(exact_match.clone());
     }
 
@@ -1,4 +1,4 @@
-use crate::api_types::{get_mount_dir, Identifier, SupportedLanguages, Symbol};
+use crate::api_types::{get_mount_dir, Identifier, SupportedLanguages};
 use crate::ast_grep::client::AstGrepClient;
 use crate::ast_grep::types::AstGrepMatch;
 use crate::lsp::client::LspClient;
@@ -215,30 +215,21 @@ impl Manager {
         if !workspace_files.contains(&file_path.to_string()) {
             return Err(LspManagerError::FileNotFound(file_path.to_string()));
         }
-        let full_path = get_mount_dir().join(file_path);
-        let full_path_str = full_path.to_str().unwrap_or_default();
-
-        self.ast_grep
-            .get_file_symbols(full_path_str)
-            .await
-            .map_err(|e| LspManagerError::InternalError(format!("Symbol retrieval failed: {}", e)))
+        self.ast_grep_symbols_in_file(file_path).await
     }
 
-    pub async fn get_symbol_from_position(
+    /// Run the ast-grep symbol scan on a file the caller has already checked is in the workspace
+    pub async fn ast_grep_symbols_in_file(
         &self,
         file_path: &str,
-        identifier_position: &lsp_types::Position,
-    ) -> Result<Symbol, LspManagerError> {
+    ) -> Result<Vec<AstGrepMatch>, LspManagerError> {
         let full_path = get_mount_dir().join(file_path);
         let full_path_str = full_path.to_str().unwrap_or_default();
-        match self
-            .ast_grep
-            .get_symbol_match_from_position(full_path_str, identifier_position)
+
+        self.ast_grep
+            .get_file_symbols(full_path_str)
             .await
-        {
-            Ok(ast_grep_symbol) => Ok(Symbol::from(ast_grep_symbol)),
-            Err(e) => Err(LspManagerError::InternalError(e.to_string())),
-        }
+            .map_err(|e| LspManagerError::InternalError(format!("Symbol retrieval failed: {}", e)))
     }
 
     pub async fn find_definition(
@@ -269,31 +260,25 @@ impl Manager {
                 LspManagerError::InternalError(format!("Definition retrieval failed: {}", e))
             })?;
 
-        // Sort the locations if there are multiple
+        // Sort the locations if there are multiple. The relative path is computed once per
+        // location rather than on every comparison.
         match &mut definition {
             GotoDefinitionResponse::Array(locations) => {
-                locations.sort_by(|a, b| {
-                    let path_a = uri_to_relative_path_string(&a.uri);
-                    let path_b = uri_to_relative_path_string(&b.uri);
-                    path_a
-                        .cmp(&path_b)
-                        .then(a.range.start.line.cmp(&b.range.start.line))
-                        .then(a.range.start.character.cmp(&b.range.start.character))
+                locations.sort_by_cached_key(|location| {
+                    (
+                        uri_to_relative_path_string(&location.uri),
+                        location.range.start.line,
+                        location.range.start.character,
+                    )
                 });
             }
             GotoDefinitionResponse::Link(links) => {
-                links.sort_by(|a, b| {
-                    let path_a = uri_to_relative_path_string(&a.target_uri);
-                    let path_b = uri_to_relative_path_string(&b.target_uri);
-                    path_a
-                        .cmp(&path_b)
-                        .then(a.target_range.start.line.cmp(&b.target_range.start.line))
-                        .then(
-                            a.target_range
-                                .start
-                                .character
-                                .cmp(&b.target_range.start.character),
-                        )
+                links.sort_by_cached_key(|link| {
+                    (
+                        uri_to_relative_path_string(&link.target_uri),
+                        link.target_range.start.line,
+                        link.target_range.start.character,
+                    )
                 });
             }
             _ => {}
@@ -430,8 +415,7 @@ impl Manager {
                     .list_files()
                     .await
                     .iter()
-                    .filter_map(|f| Some(absolute_path_to_relative_path_string(f)))
-                    .collect::<Vec<String>>(),
+                    .map(absolute_path_to_relative_path_string),
             );
         }
         files.sort();
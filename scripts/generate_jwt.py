@@ -1,11 +1,36 @@
 #!/usr/bin/env python3
 
-import jwt
+import base64
+import functools
+import hashlib
+import hmac
+import json
 import os
+import sys
 import time
-import argparse
 from datetime import datetime
 
+def _b64url(data):
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+# The HS256 header never changes, so encode it once
+_HEADER_B64 = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+
+@functools.lru_cache(maxsize=4)
+def _signer(key):
+    # Keyed HMAC state; copies skip re-deriving the key pads for each token
+    return hmac.new(key, digestmod=hashlib.sha256)
+
+def encode_hs256(claims, secret):
+    """Encode claims as an HS256-signed JWT (same output as PyJWT's jwt.encode)"""
+    payload = json.dumps(claims, separators=(',', ':')).encode()
+    signing_input = _HEADER_B64 + b'.' + _b64url(payload)
+    key = secret.encode() if isinstance(secret, str) else secret
+    mac = _signer(key).copy()
+    mac.update(signing_input)
+    signature = mac.digest()
+    return (signing_input + b'.' + _b64url(signature)).decode()
+
 def generate_token(secret=None):
     # Get JWT secret from argument or environment variable
     jwt_secret = secret or os.getenv('JWT_SECRET')
@@ -26,7 +51,7 @@ def generate_token(secret=None):
 
     try:
         # Generate token
-        token = jwt.encode(claims, jwt_secret, algorithm='HS256')
+        token = encode_hs256(claims, jwt_secret)
         
         # Print results
         print("\nGenerated JWT Token. To use in Swagger UI, copy this token and then enter it in the authorize field of the UI:")
@@ -40,9 +65,24 @@ def generate_token(secret=None):
     except Exception as e:
         print(f"Error generating token: {e}")
 
+def parse_secret_fast(argv):
+    """Return (matched, secret) for the plain invocations that don't need argparse"""
+    if not argv:
+        return True, None
+    if len(argv) == 2 and argv[0] == '--secret' and not argv[1].startswith('-'):
+        return True, argv[1]
+    if len(argv) == 1 and argv[0].startswith('--secret='):
+        return True, argv[0][len('--secret='):]
+    return False, None
+
 if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description='Generate JWT token')
-    parser.add_argument('--secret', type=str, help='JWT secret key')
-    args = parser.parse_args()
+    # argparse is slow to import relative to signing a token, so only load it
+    # for --help or anything the fast path doesn't recognise
+    matched, secret = parse_secret_fast(sys.argv[1:])
+    if not matched:
+        import argparse
+        parser = argparse.ArgumentParser(description='Generate JWT token')
+        parser.add_argument('--secret', type=str, help='JWT secret key')
+        secret = parser.parse_args().secret
     
-    generate_token(args.secret)
+    generate_token(secret)